@@ -1 +1,2 @@
-from .fsr import FSR, Galois_LFSR, Fibonacci_LFSR
\ No newline at end of file
+from .fsr import FSR, Galois_LFSR, Fibonacci_LFSR
+from .batch import LFSRBatch
@@ -0,0 +1,119 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if np is not None and hasattr(np, 'bitwise_count'):
+    def _popcount_u64(a):
+        """
+        Per-element population count of a uint64 array.
+
+        Thin wrapper over `np.bitwise_count` (numpy >= 2.0).
+
+        Args:
+            a (np.ndarray): Array of uint64 values.
+
+        Returns:
+            np.ndarray: Set-bit count of each element.
+        """
+        return np.bitwise_count(a)
+elif np is not None:
+    _POPCOUNT_LUT = np.array(
+        [bin(i).count('1') for i in range(256)], dtype=np.uint64
+    )
+
+    def _popcount_u64(a):
+        """
+        Per-element population count of a uint64 array.
+
+        Fallback for numpy < 2.0: each element is viewed as eight bytes,
+        looked up in a 256-entry table and summed.
+
+        Args:
+            a (np.ndarray): Array of uint64 values.
+
+        Returns:
+            np.ndarray: Set-bit count of each element.
+        """
+        return _POPCOUNT_LUT[a.view(np.uint8)].reshape(-1, 8).sum(axis=1)
+
+
+class LFSRBatch:
+    """
+    Ensemble of independent Fibonacci LFSRs stepped in lockstep.
+
+    States, polynomials and derived masks are stored as parallel numpy
+    uint64 arrays (structure-of-arrays), so one `step()` advances every
+    register with a handful of vectorized operations instead of a Python
+    loop over instances. Each register follows the same free-running
+    recurrence as `Fibonacci_LFSR` (output bit fed back as `tap_in`, no
+    serial input), so lane `k` reproduces the sequence of
+    `Fibonacci_LFSR(polys[k], states[k])`.
+
+    Requires numpy (the `fast` extra); registers are limited to 64 bits.
+
+    Args:
+        polys (sequence[int]): Characteristic polynomials, one per lane.
+        states (sequence[int]): Initial seed states, one per lane.
+
+    Attributes:
+        polys (np.ndarray): Polynomials, packed as uint64.
+        states (np.ndarray): Current states, packed as uint64.
+        masks (np.ndarray): Register width masks per lane.
+        taps (np.ndarray): Free-running feedback tap masks per lane.
+    """
+    def __init__(self, polys, states):
+        if np is None:
+            raise ImportError(
+                'LFSRBatch requires numpy; install fsr-tools[fast]'
+            )
+        if len(polys) != len(states):
+            raise ValueError('polys and states must have the same length')
+        orders = [int(p).bit_length() for p in polys]
+        if max(orders, default=0) > 64:
+            raise ValueError('LFSRBatch supports registers up to 64 bits')
+        masks = [(1 << n) - 1 for n in orders]
+        self.polys = np.asarray(polys, dtype=np.uint64)
+        self.masks = np.asarray(masks, dtype=np.uint64)
+        self.taps = (self.polys & (self.masks >> np.uint64(1))) \
+            ^ np.uint64(1)
+        self.states = np.asarray(states, dtype=np.uint64)
+        self.__init_states = self.states.copy()
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def step(self):
+        """
+        Advance every register by one free-running step.
+
+        The feedback bit of each lane is the parity of its masked taps
+        (output bit included); all lanes shift and reinsert together as
+        three vectorized array operations.
+
+        Returns:
+            np.ndarray: The updated states, packed as uint64.
+        """
+        feedback = _popcount_u64(self.states & self.taps) & np.uint64(1)
+        self.states = ((self.states << np.uint64(1)) & self.masks) | feedback
+        return self.states
+
+    def cycle(self, rounds: int):
+        """
+        Advance every register by a specified number of steps.
+
+        Args:
+            rounds (int): Number of free-running steps to perform.
+
+        Returns:
+            np.ndarray: The final states, packed as uint64.
+        """
+        for _ in range(rounds):
+            self.step()
+        return self.states
+
+    def reset(self):
+        """
+        Reset every register to its initial seed state.
+        """
+        self.states = self.__init_states.copy()
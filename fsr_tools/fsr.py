@@ -1,4 +1,337 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _fib_advance(state, tap, mask, in_bit, rounds):
+    """
+    Advance a Fibonacci LFSR state by `rounds` steps.
+
+    Tight integer loop shared by the pure-Python and numba-jitted paths:
+    every name is local, the feedback parity is computed by a branch-free
+    shift-xor fold, and `in_bit` carries the constant `serial_in ^ tap_in`
+    contribution of each round.
+
+    Args:
+        state (int): Current register state.
+        tap (int): Feedback tap mask (MSB excluded).
+        mask (int): Register width mask.
+        in_bit (int): Constant bit XORed into the feedback each round.
+        rounds (int): Number of steps to advance.
+
+    Returns:
+        int: The register state after `rounds` steps.
+    """
+    for _ in range(rounds):
+        parity = state & tap
+        parity ^= parity >> 32
+        parity ^= parity >> 16
+        parity ^= parity >> 8
+        parity ^= parity >> 4
+        parity ^= parity >> 2
+        parity ^= parity >> 1
+        state = ((state << 1) & mask) | ((parity ^ in_bit) & 1)
+    return state
+
+
+def _gal_advance(state, feed, rounds):
+    """
+    Advance a Galois LFSR state by `rounds` steps.
+
+    With fixed inputs the Galois round collapses to a shift plus a
+    constant XOR; `feed` is that constant (tap injections plus the MSB
+    input bit), precomputed by the caller.
+
+    Args:
+        state (int): Current register state.
+        feed (int): Constant XOR pattern applied after each shift.
+        rounds (int): Number of steps to advance.
+
+    Returns:
+        int: The register state after `rounds` steps.
+    """
+    for _ in range(rounds):
+        state = (state >> 1) ^ feed
+    return state
+
+
+if njit is not None:
+    _fib_advance = njit(
+        'int64(int64, int64, int64, int64, int64)', cache=True
+    )(_fib_advance)
+    _gal_advance = njit(
+        'int64(int64, int64, int64)', cache=True
+    )(_gal_advance)
+
+
+if hasattr(int, 'bit_count'):
+    def _parity(x: int) -> int:
+        """
+        GF(2) parity of a packed bit-vector.
+
+        Uses `int.bit_count` (Python >= 3.10), a single C-level
+        population count — no loops or branches per tap.
+
+        Args:
+            x (int): Bit-vector packed as an int.
+
+        Returns:
+            int: 1 if an odd number of bits is set, else 0.
+        """
+        return x.bit_count() & 1
+else:
+    def _parity(x: int) -> int:
+        """
+        GF(2) parity of a packed bit-vector.
+
+        Fallback for Python < 3.10, where `int.bit_count` is not
+        available: count set bits via the binary string form.
+
+        Args:
+            x (int): Bit-vector packed as an int.
+
+        Returns:
+            int: 1 if an odd number of bits is set, else 0.
+        """
+        return bin(x).count('1') & 1
+
+
+@lru_cache(maxsize=None)
+def _poly_artifacts(poly: int):
+    """
+    Compute the polynomial-derived register constants.
+
+    Everything here is a function of `poly` alone, so results are
+    memoized: registers sharing a polynomial (or reconstructed with one)
+    pay the parse cost once per distinct polynomial per process.
+
+    Args:
+        poly (int): Characteristic polynomial in integer form.
+
+    Returns:
+        tuple: `(field_order, tap_mask, mask, tap)` where `tap_mask` is
+            the LSB-first tap tuple, `mask` the register width mask and
+            `tap` the feedback tap mask (MSB excluded).
+    """
+    field_order = poly.bit_length()
+    tap_mask = tuple(
+        int(b) for b in f'{poly:0{field_order}b}'
+    )[::-1]
+    mask = (1 << field_order) - 1
+    tap = poly & (mask >> 1)
+    return field_order, tap_mask, mask, tap
+
+
+@lru_cache(maxsize=None)
+def _compile_fib_step(poly: int):
+    """
+    Generate a specialized free-running Fibonacci step for a polynomial.
+
+    The tap positions are constants once `poly` is fixed, so the step is
+    emitted as source with the feedback parity unrolled into a single
+    XOR chain of shifts and compiled with `exec` — one bytecode
+    expression per step instead of a loop over taps. Compiled steps are
+    memoized per polynomial.
+
+    Args:
+        poly (int): Characteristic polynomial in integer form.
+
+    Returns:
+        callable: `step(state) -> state` advancing one free-running step.
+    """
+    order, _, mask, tap = _poly_artifacts(poly)
+    feed = tap ^ 1
+    shifts = [k for k in range(order) if feed >> k & 1]
+    parity = ' ^ '.join(f'(s >> {k})' for k in shifts) or '0'
+    source = (
+        f'def _step(s):\n'
+        f'    return ((s << 1) & {mask}) | (({parity}) & 1)\n'
+    )
+    namespace = {}
+    exec(source, namespace)
+    return namespace['_step']
+
+
+@lru_cache(maxsize=None)
+def _compile_gal_step(poly: int):
+    """
+    Generate a specialized free-running Galois step for a polynomial.
+
+    The tap injection pattern is a constant once `poly` is fixed, so the
+    step is emitted as source with that constant inlined and compiled
+    with `exec`. Compiled steps are memoized per polynomial.
+
+    Args:
+        poly (int): Characteristic polynomial in integer form.
+
+    Returns:
+        callable: `step(state) -> state` advancing one free-running step.
+    """
+    order = poly.bit_length()
+    feed = (poly >> 1) | (1 << (order - 1))
+    source = (
+        f'def _step(s):\n'
+        f'    return (s >> 1) ^ (-(s & 1) & {feed})\n'
+    )
+    namespace = {}
+    exec(source, namespace)
+    return namespace['_step']
+
+
+def _gf2_mod(a: int, mod: int) -> int:
+    """
+    Reduce a GF(2)[x] polynomial modulo another.
+
+    Polynomials are packed as ints, one coefficient per bit. Reduction
+    is long division with XOR subtraction.
+
+    Args:
+        a (int): Polynomial to reduce.
+        mod (int): Modulus polynomial.
+
+    Returns:
+        int: `a mod mod` as a packed int.
+    """
+    degree = mod.bit_length()
+    while a.bit_length() >= degree:
+        a ^= mod << (a.bit_length() - degree)
+    return a
+
+
+def _gf2_mulmod(a: int, b: int, mod: int) -> int:
+    """
+    Carry-less multiply two GF(2)[x] polynomials modulo a third.
+
+    The product is a shift-and-XOR convolution (Python int XOR is a
+    word-parallel carry-less operation), reduced with `_gf2_mod`.
+
+    Args:
+        a (int): First factor, packed as an int.
+        b (int): Second factor, packed as an int.
+        mod (int): Modulus polynomial.
+
+    Returns:
+        int: `a * b mod mod` as a packed int.
+    """
+    product = 0
+    while b:
+        if b & 1:
+            product ^= a
+        a <<= 1
+        b >>= 1
+    return _gf2_mod(product, mod)
+
+
+def _gf2_powmod(base: int, exp: int, mod: int) -> int:
+    """
+    Raise a GF(2)[x] polynomial to an integer power modulo another.
+
+    Square-and-multiply: O(log(exp)) carry-less multiplications.
+
+    Args:
+        base (int): Base polynomial, packed as an int.
+        exp (int): Non-negative integer exponent.
+        mod (int): Modulus polynomial.
+
+    Returns:
+        int: `base ** exp mod mod` as a packed int.
+    """
+    result = 1
+    base = _gf2_mod(base, mod)
+    while exp:
+        if exp & 1:
+            result = _gf2_mulmod(result, base, mod)
+        base = _gf2_mulmod(base, base, mod)
+        exp >>= 1
+    return result
+
+
+def _gf2_invert(rows):
+    """
+    Invert a square GF(2) matrix with rows packed as ints.
+
+    Gauss-Jordan elimination where adding one row to another is a single
+    XOR on the packed int, regardless of matrix size.
+
+    Args:
+        rows (list[int]): Rows of the matrix, packed as ints.
+
+    Returns:
+        list[int]: Rows of the inverse matrix, packed as ints.
+
+    Raises:
+        ValueError: If the matrix is singular.
+    """
+    size = len(rows)
+    rows = list(rows)
+    inverse = [1 << i for i in range(size)]
+    for col in range(size):
+        pivot = next(
+            (r for r in range(col, size) if rows[r] >> col & 1), None
+        )
+        if pivot is None:
+            raise ValueError('matrix is singular over GF(2)')
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        inverse[col], inverse[pivot] = inverse[pivot], inverse[col]
+        for r in range(size):
+            if r != col and rows[r] >> col & 1:
+                rows[r] ^= rows[col]
+                inverse[r] ^= inverse[col]
+    return inverse
+
+
+def _gf2_affine_apply(cols, const, state: int) -> int:
+    """
+    Apply an affine GF(2) map to a state bit-vector.
+
+    The map is stored column-wise: `cols[k]` is the image of the basis
+    vector `1 << k` (with the constant removed) and `const` is the image
+    of the zero vector.
+
+    Args:
+        cols (list[int]): Columns of the linear part, packed as ints.
+        const (int): Constant (affine) term, packed as an int.
+        state (int): State bit-vector, packed as an int.
+
+    Returns:
+        int: The mapped state as an integer.
+    """
+    result = const
+    k = 0
+    while state:
+        if state & 1:
+            result ^= cols[k]
+        state >>= 1
+        k += 1
+    return result
+
+
+def _gf2_affine_compose(cols_a, const_a, cols_b, const_b):
+    """
+    Compose two affine GF(2) maps, applying `b` first and `a` second.
+
+    Args:
+        cols_a (list[int]): Columns of the outer map's linear part.
+        const_a (int): Constant term of the outer map.
+        cols_b (list[int]): Columns of the inner map's linear part.
+        const_b (int): Constant term of the inner map.
+
+    Returns:
+        tuple[list[int], int]: Columns and constant of the composed map.
+    """
+    cols = [_gf2_affine_apply(cols_a, 0, col) for col in cols_b]
+    const = _gf2_affine_apply(cols_a, const_a, const_b)
+    return cols, const
+
 
 class FSR(ABC):
     """
@@ -19,6 +352,12 @@ class FSR(ABC):
                     The binary representation indicates taps, with the MSB
                     corresponding to the highest degree term (register width).
         state (int): Initial seed state of the register.
+        primitive (bool, optional): Assert that the polynomial is
+                    primitive, i.e. the free-running sequence is maximum
+                    length. Sets the period to `2^n - 1` without
+                    detection. Only valid for forms that can reach
+                    maximum length (e.g. the Galois form; the Fibonacci
+                    form rejects it). Defaults to False.
 
     Attributes:
         state (int): Current state of the shift register.
@@ -30,11 +369,18 @@ class FSR(ABC):
         - Subclasses must implement `round()` to define one shift/update step.
         - The polynomial should be primitive for maximum-length sequences.
     """
-    def __init__(self, poly: int, state: int):
+    def __init__(self, poly: int, state: int, primitive: bool = False):
         self.state = state
         self.poly = poly
         self.__init_state = state
         self.build_poly()
+        self._primitive = primitive
+        if primitive:
+            self._period = (1 << self.field_order) - 1
+            self._period_tail = 0
+        else:
+            self._period = None
+            self._period_tail = 0
 
     def build_poly(self):
         """
@@ -48,6 +394,16 @@ class FSR(ABC):
         The polynomial is interpreted in binary form, with the most significant bit
         corresponding to the highest degree term.
 
+        In addition to the tap mask list, two integer masks are precomputed
+        for the bitwise round implementations:
+          - `_mask`: register width mask, `(1 << field_order) - 1`.
+          - `_tap`: feedback tap mask, the polynomial restricted to the
+            register body (MSB excluded).
+
+        All of these depend only on `poly`, so the computation is
+        memoized by `_poly_artifacts` and shared across registers with
+        the same polynomial.
+
         Example:
             poly = 0b10011  # x^4 + x + 1
             field_order = 5
@@ -59,10 +415,24 @@ class FSR(ABC):
         Returns:
             None
         """
-        self.field_order = self.poly.bit_length()
-        self.tap_mask = [
-            int(b) for b in f'{self.poly:0{self.field_order}b}'
-        ][::-1]
+        self.field_order, tap_mask, self._mask, self._tap = \
+            _poly_artifacts(self.poly)
+        self.tap_mask = list(tap_mask)
+        self._step = self._compile_step()
+
+    def _compile_step(self):
+        """
+        Get the specialized free-running step for this register.
+
+        The LFSR subclasses return a step compiled for their form and
+        polynomial; the generic base has no specialization, so the
+        free-running hot paths fall back to `round()`.
+
+        Returns:
+            callable | None: `step(state) -> state`, or None when no
+                specialization exists.
+        """
+        return None
 
     @abstractmethod
     def round(self, serial_in=0, tap_in=0) -> int:
@@ -84,13 +454,18 @@ class FSR(ABC):
         pass
 
     def __getitem__(self, reg: int) -> int:
-        bits = [int(x) for x in f'{self.state:0{self.field_order}b}'][::-1]
-        return bits[reg]
+        if reg < 0:
+            reg += self.field_order
+        if not 0 <= reg < self.field_order:
+            raise IndexError('register index out of range')
+        return (self.state >> reg) & 1
 
     def __setitem__(self, reg: int, val: int):
-        bits = [int(x) for x in f'{self.state:0{self.field_order}b}'][::-1]
-        bits[reg] = val
-        self.state = int(''.join(str(b) for b in bits), 2)
+        if reg < 0:
+            reg += self.field_order
+        if not 0 <= reg < self.field_order:
+            raise IndexError('register index out of range')
+        self.state = (self.state & ~(1 << reg)) | ((val & 1) << reg)
 
     @property
     def algebraic(self):
@@ -110,9 +485,9 @@ class FSR(ABC):
             str: The polynomial in human-readable algebraic form.
         """
         terms = []
-        for i, bit in enumerate(self.tap_mask):
-            if bit:
-                power = self.field_order - i
+        for bit in range(self.field_order):
+            if self.poly >> bit & 1:
+                power = self.field_order - bit
                 terms.append(f'x^{power}' if power > 1 else 'x')
         terms.append('1')
         return ' + '.join(terms)
@@ -131,28 +506,97 @@ class FSR(ABC):
 
         The register is reset to its initial state after generation.
 
+        When numpy is installed (and the register fits in 64 bits), the
+        columns are returned as numpy arrays: states are packed into a
+        `uint64` array and the binary strings are produced by a single
+        vectorized bits-to-characters pass instead of one format call
+        per cycle. Without numpy, plain Python lists are returned.
+
         Returns:
             dict: A dictionary with keys:
-                - "Cycle" (list[int]): Cycle numbers from 0 to 2^n - 1.
-                - "State" (list[int]): Integer representation of the state.
-                - "Register State" (list[str]): Binary string of the state.
+                - "Cycle": Cycle numbers from 0 to 2^n - 1.
+                - "State": Integer representation of the state.
+                - "Register State": Binary string of the state.
         """
+        order = self.field_order
+        size = 2 ** order
+        fsr_round = self.round
+        step = self._step
+        if np is not None and order <= 64:
+            states = np.empty(size, dtype=np.uint64)
+            if step is not None:
+                current = self.state
+                for x in range(size):
+                    states[x] = current
+                    current = step(current)
+            else:
+                for x in range(size):
+                    states[x] = self.state
+                    fsr_round(serial_in=0, tap_in=self.state & 1)
+            self.reset()
+            shifts = np.arange(order - 1, -1, -1, dtype=np.uint64)
+            digits = ((states[:, None] >> shifts) & 1).astype(np.uint8) + 48
+            register_states = np.ascontiguousarray(digits).view(
+                f'S{order}'
+            ).ravel().astype(f'<U{order}')
+            return {
+                'Cycle': np.arange(size),
+                'State': states,
+                'Register State': register_states,
+            }
         state_table = {'Cycle': [], 'State': [], 'Register State': []}
-        for x in range(0, 2 ** self.field_order):
+        current = self.state
+        for x in range(size):
             state_table['Cycle'].append(x)
-            state_table['State'].append(self.state)
+            state_table['State'].append(current)
             state_table['Register State'].append(
-                f'{self.state:0{self.field_order}b}'
+                f'{current:0{order}b}'
             )
-            self.round(serial_in=0, tap_in=self[0])
+            if step is not None:
+                current = step(current)
+            else:
+                self.state = current
+                current = fsr_round(serial_in=0, tap_in=current & 1)
         self.reset()
         return state_table
 
+    def _round_matrix(self, serial_in: int, tap_in: int):
+        """
+        Extract one round as an affine GF(2) map over the state.
+
+        For fixed `serial_in`/`tap_in`, a shift register round is an
+        affine map `state -> A @ state ^ c` over GF(2). The map is probed
+        directly from `round()`: the constant term is the image of the
+        zero state and each column of A is the image of a basis state
+        with the constant removed. The register state is preserved.
+
+        Args:
+            serial_in (int): Bit shifted into the register each round.
+            tap_in (int): Feedback bit used each round.
+
+        Returns:
+            tuple[list[int], int]: Columns of A (packed as ints) and the
+                constant term c.
+        """
+        saved = self.state
+        self.state = 0
+        const = self.round(serial_in, tap_in)
+        cols = []
+        for k in range(self.field_order):
+            self.state = 1 << k
+            cols.append(self.round(serial_in, tap_in) ^ const)
+        self.state = saved
+        return cols, const
+
     def cycle(self, rounds: int, serial_in: int, tap_in: int) ->  int:
         """
         Advance the LFSR by a specified number of rounds.
 
-        Repeatedly calls `round()` to update the register state.
+        For small round counts this repeatedly calls `round()`. For
+        large round counts the round is treated as an affine GF(2) map
+        and raised to the `rounds` power by binary exponentiation,
+        advancing the register in O(n^2 log(rounds)) operations instead
+        of O(rounds) round calls.
 
         Args:
             rounds (int): Number of shift/update operations to perform.
@@ -162,6 +606,301 @@ class FSR(ABC):
         Returns:
             int: The final register state as an integer after all rounds.
         """
+        if rounds > self.field_order ** 2:
+            cols, const = self._round_matrix(serial_in, tap_in)
+            jump_cols = [1 << k for k in range(self.field_order)]
+            jump_const = 0
+            while rounds:
+                if rounds & 1:
+                    jump_cols, jump_const = _gf2_affine_compose(
+                        cols, const, jump_cols, jump_const
+                    )
+                rounds >>= 1
+                if rounds:
+                    cols, const = _gf2_affine_compose(
+                        cols, const, cols, const
+                    )
+            self.state = _gf2_affine_apply(jump_cols, jump_const, self.state)
+            return self.state
+        return self._advance(rounds, serial_in, tap_in)
+
+    @property
+    def period(self):
+        """
+        Get the period of the free-running sequence from the current
+        state.
+
+        Detected with Brent's cycle-finding algorithm over the
+        free-running step — O(period) steps and O(1) memory, run once
+        and cached. The detected value is anchored to the state held at
+        access time and describes that state's orbit; `load()` and
+        `reset()` discard it, since they may move the register to a
+        different orbit. Registers constructed with `primitive=True`
+        skip detection and report `2^n - 1` directly. Some registers
+        only enter their cycle after a leading tail of states; the tail
+        length is detected alongside and accounted for when jump
+        distances are reduced modulo the period.
+
+        Returns:
+            int: Length of the repeating cycle of the free-running
+                sequence started from the current state.
+        """
+        if self._period is None:
+            step = self._step
+            saved = self.state
+            if step is None:
+                def step(s):
+                    self.state = s
+                    return self.round(0, s & 1)
+            start = saved
+            power = length = 1
+            tortoise = start
+            hare = step(start)
+            while tortoise != hare:
+                if power == length:
+                    tortoise = hare
+                    power *= 2
+                    length = 0
+                hare = step(hare)
+                length += 1
+            tortoise = hare = start
+            for _ in range(length):
+                hare = step(hare)
+            tail = 0
+            while tortoise != hare:
+                tortoise = step(tortoise)
+                hare = step(hare)
+                tail += 1
+            self.state = saved
+            self._period = length
+            self._period_tail = tail
+        return self._period
+
+    def _reduce_rounds(self, rounds: int) -> int:
+        """
+        Reduce a jump distance modulo the known period.
+
+        The free-running sequence repeats with period p after its tail,
+        so a jump of M steps lands on the same state as
+        `tail + (M - tail) mod p` steps. Only applies once the period is
+        known (via `primitive=True` or a prior `period` access) —
+        detection is O(period) and is never triggered implicitly.
+
+        Args:
+            rounds (int): Requested number of free-running steps.
+
+        Returns:
+            int: Equivalent, possibly smaller, number of steps.
+        """
+        if self._period is not None and rounds > self._period_tail:
+            rounds = self._period_tail \
+                + (rounds - self._period_tail) % self._period
+        return rounds
+
+    def jump(self, rounds: int) -> int:
+        """
+        Jump the free-running register ahead by `rounds` steps.
+
+        A free-running step feeds the output bit back as `tap_in` with
+        no serial input — the same recurrence `state_table` follows.
+        The step is a linear GF(2) map, so the jump is performed by
+        probing the map from `round()` and raising it to the `rounds`
+        power by binary exponentiation, in O(n^2 log(rounds)) operations
+        instead of O(rounds) round calls.
+
+        Known periods (`primitive=True` or a prior `period` access)
+        reduce the jump distance modulo the period first.
+
+        Args:
+            rounds (int): Number of free-running steps to jump.
+
+        Returns:
+            int: The final register state as an integer.
+        """
+        rounds = self._reduce_rounds(rounds)
+        saved = self.state
+        self.state = 0
+        const = self.round(0, 0)
+        cols = []
+        for k in range(self.field_order):
+            self.state = 1 << k
+            cols.append(self.round(0, 1 if k == 0 else 0) ^ const)
+        self.state = saved
+        jump_cols = [1 << k for k in range(self.field_order)]
+        jump_const = 0
+        while rounds:
+            if rounds & 1:
+                jump_cols, jump_const = _gf2_affine_compose(
+                    cols, const, jump_cols, jump_const
+                )
+            rounds >>= 1
+            if rounds:
+                cols, const = _gf2_affine_compose(cols, const, cols, const)
+        self.state = _gf2_affine_apply(jump_cols, jump_const, self.state)
+        return self.state
+
+    @property
+    def _out_shift(self) -> int:
+        """
+        Get the bit position of the serial output.
+
+        Defaults to the LSB; subclasses override this to match their
+        shift direction.
+
+        Returns:
+            int: Shift amount selecting the output bit of a state.
+        """
+        return 0
+
+    @property
+    def serial_out(self) -> int:
+        """
+        Get the register's serial output bit.
+
+        The bit shifted out of the register on the next round, at the
+        position `_out_shift` selects for this form.
+
+        Returns:
+            int: The output bit of the current state.
+        """
+        return (self.state >> self._out_shift) & 1
+
+    _recovery_cache = {}
+
+    def _obs_to_state(self):
+        """
+        Build the observations-to-state matrix for this register.
+
+        For an n-bit register, the n serial output bits of a
+        free-running run are a linear GF(2) function of the starting
+        state. The forward matrix is probed by running each basis state
+        n steps and capturing `serial_out` per step; its inverse maps
+        any n observed bits back to the state that produced them. The
+        result is cached per (form, polynomial), so repeated recoveries
+        pay the probe-and-invert cost once.
+
+        Returns:
+            list[int]: Columns of the inverse matrix, packed as ints:
+                entry `i` is XORed into the state when observed bit `i`
+                is set.
+
+        Raises:
+            ValueError: If the observations do not determine the state
+                for this polynomial.
+        """
+        key = (type(self), self.poly)
+        columns = FSR._recovery_cache.get(key)
+        if columns is None:
+            order = self.field_order
+            saved = self.state
+            obs_cols = []
+            for k in range(order):
+                self.state = 1 << k
+                observed = 0
+                for i in range(order):
+                    observed |= self.serial_out << i
+                    self.round(0, self.state & 1)
+                obs_cols.append(observed)
+            self.state = saved
+            obs_rows = [
+                sum(
+                    (obs_cols[k] >> i & 1) << k for k in range(order)
+                ) for i in range(order)
+            ]
+            inv_rows = _gf2_invert(obs_rows)
+            columns = [
+                sum(
+                    (inv_rows[k] >> i & 1) << k for k in range(order)
+                ) for i in range(order)
+            ]
+            FSR._recovery_cache[key] = columns
+        return columns
+
+    def recover_state(self, observed_bits) -> int:
+        """
+        Recover a register state from observed output bits.
+
+        Given the `field_order` serial output bits emitted by a
+        free-running register with an unknown state (oldest bit first),
+        reconstructs that state in O(n) XORs using the precomputed
+        observations-to-state matrix. The register's own state is not
+        modified; pass the result to `load` to continue the observed
+        sequence.
+
+        Args:
+            observed_bits (sequence[int]): `field_order` consecutive
+                `serial_out` bits, oldest first.
+
+        Returns:
+            int: The state the register held before the first observed
+                bit was emitted.
+
+        Raises:
+            ValueError: If the wrong number of bits is supplied or the
+                state is not recoverable for this polynomial.
+        """
+        bits = list(observed_bits)
+        if len(bits) != self.field_order:
+            raise ValueError(
+                f'expected {self.field_order} observed bits, got {len(bits)}'
+            )
+        columns = self._obs_to_state()
+        state = 0
+        for i, bit in enumerate(bits):
+            if bit & 1:
+                state ^= columns[i]
+        return state
+
+    def stream(self, n_bytes: int) -> bytes:
+        """
+        Emit a keystream from the free-running register.
+
+        Runs the free-running recurrence (output bit fed back as
+        `tap_in`, no serial input) for `8 * n_bytes` steps, collecting
+        the `serial_out` bit of each step — so the first `field_order`
+        bits are exactly what `recover_state` expects. Bits are packed
+        least significant first within each byte and accumulated into a
+        single int, so the loop does no per-bit allocation; the bytes
+        are produced by one `to_bytes` call at the end.
+
+        Args:
+            n_bytes (int): Number of keystream bytes to generate.
+
+        Returns:
+            bytes: The keystream, LSB-first within each byte.
+        """
+        step = self._step
+        shift = self._out_shift
+        out = 0
+        if step is not None:
+            current = self.state
+            for i in range(8 * n_bytes):
+                out |= ((current >> shift) & 1) << i
+                current = step(current)
+            self.state = current
+        else:
+            fsr_round = self.round
+            for i in range(8 * n_bytes):
+                out |= self.serial_out << i
+                fsr_round(0, self.state & 1)
+        return out.to_bytes(n_bytes, 'little')
+
+    def _advance(self, rounds: int, serial_in: int, tap_in: int) -> int:
+        """
+        Advance the register by repeated rounds.
+
+        Generic fallback that loops over `round()`. Subclasses override
+        this with a dedicated step kernel (numba-jitted when available)
+        for registers that fit in 64 bits.
+
+        Args:
+            rounds (int): Number of shift/update operations to perform.
+            serial_in (int): Bit to shift into the register each round.
+            tap_in (int): Feedback bit to use each round.
+
+        Returns:
+            int: The final register state as an integer.
+        """
         for _ in range(rounds):
             self.round(serial_in, tap_in)
         return self.state
@@ -170,21 +909,34 @@ class FSR(ABC):
         """
         Reset the register to its initial seed state.
 
-        Sets the current state back to the value provided during initialization.
+        Sets the current state back to the value provided during
+        initialization. A period detected from a previous state is
+        discarded along with its orbit; a period asserted with
+        `primitive=True` is kept.
         """
         self.state = self.__init_state
+        if not self._primitive:
+            self._period = None
+            self._period_tail = 0
 
     def load(self, state: int):
         """
         Load a new state into the register.
 
+        A period detected from a previous state only describes that
+        state's orbit, so it is discarded; a period asserted with
+        `primitive=True` holds for every nonzero state and is kept.
+
         Args:
             state (int): The new register state as an integer.
         """
         self.state = state
+        if not self._primitive:
+            self._period = None
+            self._period_tail = 0
 
 
-class Galois_LFSR(LFSR):
+class Galois_LFSR(FSR):
     """
     Galois form Linear Feedforward Shift Register.
 
@@ -196,6 +948,15 @@ class Galois_LFSR(LFSR):
         poly (int): Characteristic polynomial in integer form.
         state (int): Initial seed state of the register.
     """
+    def _compile_step(self):
+        """
+        Get the specialized free-running Galois step.
+
+        Returns:
+            callable: `step(state) -> state` for this polynomial.
+        """
+        return _compile_gal_step(self.poly)
+
     def round(self, serial_in=0, tap_in=0) -> int:
         """
         Perform one Galois LFSR shift step.
@@ -211,19 +972,62 @@ class Galois_LFSR(LFSR):
         Returns:
             int: The updated register state as an integer.
         """
-        bits = [int(x) for x in f'{self.state:0{self.field_order}b}'][::-1]
-        next_bits = [0] * self.field_order
-        next_bits[self.field_order-1] = serial_in ^ tap_in
-        for i in range(1, self.field_order):
-            if self.tap_mask[i]:
-                next_bits[i-1] = bits[i] ^ tap_in;
-            else:
-                next_bits[i-1] = bits[i]
-        self.state = int(''.join(str(b) for b in next_bits[::-1]), 2)
+        state = (self.state >> 1) ^ (-tap_in & (self.poly >> 1))
+        self.state = state | ((serial_in ^ tap_in) << (self.field_order - 1))
         return self.state
 
+    def _advance(self, rounds: int, serial_in: int, tap_in: int) -> int:
+        """
+        Advance the register via the Galois step kernel.
 
-class Fibonacci_LFSR(LFSR):
+        The tap injections and MSB input bit are constant across rounds,
+        so they are folded into a single XOR pattern fed to
+        `_gal_advance`. Registers wider than 63 bits (the signed 64-bit
+        range the jitted kernel is typed for) fall back to the generic
+        round loop.
+
+        Args:
+            rounds (int): Number of shift/update operations to perform.
+            serial_in (int): Bit to shift into the register each round.
+            tap_in (int): Feedback bit to use each round.
+
+        Returns:
+            int: The final register state as an integer.
+        """
+        if self.field_order > 63:
+            return super()._advance(rounds, serial_in, tap_in)
+        feed = (-tap_in & (self.poly >> 1)) \
+            | ((serial_in ^ tap_in) << (self.field_order - 1))
+        self.state = int(_gal_advance(self.state, feed, rounds))
+        return self.state
+
+    def jump(self, rounds: int) -> int:
+        """
+        Jump the free-running register ahead by `rounds` steps.
+
+        A free-running Galois step is multiplication by x^-1 in
+        GF(2)[x] modulo `x^n + poly`, so the jump collapses to a single
+        carry-less multiplication by `(x^-1)^rounds mod (x^n + poly)`,
+        computed by square-and-multiply — O(log(rounds)) carry-less
+        multiplications on packed ints. Known periods (`primitive=True`
+        or a prior `period` access) reduce the jump distance modulo the
+        period first.
+
+        Args:
+            rounds (int): Number of free-running steps to jump.
+
+        Returns:
+            int: The final register state as an integer.
+        """
+        rounds = self._reduce_rounds(rounds)
+        modulus = (1 << self.field_order) | (self.poly & ~1) | 1
+        x_inverse = (modulus ^ 1) >> 1
+        factor = _gf2_powmod(x_inverse, rounds, modulus)
+        self.state = _gf2_mulmod(self.state, factor, modulus)
+        return self.state
+
+
+class Fibonacci_LFSR(FSR):
     """
     Fibonacci form Linear Feedback Shift Register.
 
@@ -231,10 +1035,50 @@ class Fibonacci_LFSR(LFSR):
     by XORing selected taps from the current state and then shifting
     it into the register.
 
+    The `primitive` flag is rejected for this form: the free-running
+    feedback never taps the MSB, so states differing only in that bit
+    collide and no polynomial reaches the `2^n - 1` maximum length the
+    flag would assert. Use the `period` property to detect the actual
+    period instead.
+
     Args:
         poly (int): Characteristic polynomial in integer form.
         state (int): Initial seed state of the register.
+
+    Raises:
+        ValueError: If constructed with `primitive=True`.
     """
+    def __init__(self, poly: int, state: int, primitive: bool = False):
+        if primitive:
+            raise ValueError(
+                'primitive is not supported for the Fibonacci form: '
+                'the free-running feedback never taps the MSB, so the '
+                'sequence cannot reach the 2^n - 1 maximum length'
+            )
+        super().__init__(poly, state)
+
+    @property
+    def _out_shift(self) -> int:
+        """
+        Get the bit position of the serial output.
+
+        The Fibonacci form shifts toward the MSB, so the bit leaving the
+        register is the MSB of the current state.
+
+        Returns:
+            int: Shift amount selecting the output bit of a state.
+        """
+        return self.field_order - 1
+
+    def _compile_step(self):
+        """
+        Get the specialized free-running Fibonacci step.
+
+        Returns:
+            callable: `step(state) -> state` for this polynomial.
+        """
+        return _compile_fib_step(self.poly)
+
     def round(self, serial_in=0, tap_in=0) -> int:
         """
         Perform one Fibonacci LFSR shift step.
@@ -249,13 +1093,30 @@ class Fibonacci_LFSR(LFSR):
         Returns:
             int: The updated register state as an integer.
         """
-        bits = [int(x) for x in f'{self.state:0{self.field_order}b}'][::-1]
-        next_bits = [0] * self.field_order
-        feedback = tap_in
-        for i in range(0, self.field_order-1):
-            next_bits[i+1] = bits[i];
-            if self.tap_mask[i]:
-                feedback ^= bits[i]
-        next_bits[0] = serial_in ^ feedback
-        self.state = int(''.join(str(b) for b in next_bits[::-1]), 2)
+        feedback = serial_in ^ tap_in ^ _parity(self.state & self._tap)
+        self.state = ((self.state << 1) & self._mask) | feedback
+        return self.state
+
+    def _advance(self, rounds: int, serial_in: int, tap_in: int) -> int:
+        """
+        Advance the register via the Fibonacci step kernel.
+
+        The constant `serial_in ^ tap_in` contribution is folded into a
+        single bit fed to `_fib_advance`. Registers wider than 63 bits
+        (the signed 64-bit range the jitted kernel is typed for) fall
+        back to the generic round loop.
+
+        Args:
+            rounds (int): Number of shift/update operations to perform.
+            serial_in (int): Bit to shift into the register each round.
+            tap_in (int): Feedback bit to use each round.
+
+        Returns:
+            int: The final register state as an integer.
+        """
+        if self.field_order > 63:
+            return super()._advance(rounds, serial_in, tap_in)
+        self.state = int(_fib_advance(
+            self.state, self._tap, self._mask, serial_in ^ tap_in, rounds
+        ))
         return self.state